@@ -0,0 +1,25 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# Optional compiled UV remap kernel for atlasify_selected_object.py (build with
+# setup_extensions.py); used when numba is not installed, before the NumPy fallback.
+
+def remap(const float[:, ::1] src, float[:, ::1] dst, const int[::1] loop_start,
+          const int[::1] loop_total, const int[::1] mat_idx, const float[:, ::1] rects,
+          const unsigned char[::1] mask):
+    """Per-polygon remap: each polygon's loops get its slot's rect (u0, v0, du, dv, rotated),
+    with u/v swapped for rotated rects, or a plain copy when mask[slot] is 0."""
+    cdef Py_ssize_t p, li, ls, le, m
+    cdef float u0, v0, du, dv
+    with nogil:
+        for p in range(loop_start.shape[0]):
+            m = mat_idx[p]; ls = loop_start[p]; le = ls + loop_total[p]
+            if not mask[m]:
+                for li in range(ls, le):
+                    dst[li, 0] = src[li, 0]; dst[li, 1] = src[li, 1]
+                continue
+            u0 = rects[m, 0]; v0 = rects[m, 1]; du = rects[m, 2]; dv = rects[m, 3]
+            if rects[m, 4] == 1:
+                for li in range(ls, le):
+                    dst[li, 0] = u0 + src[li, 1]*du; dst[li, 1] = v0 + src[li, 0]*dv
+            else:
+                for li in range(ls, le):
+                    dst[li, 0] = u0 + src[li, 0]*du; dst[li, 1] = v0 + src[li, 1]*dv
@@ -5,32 +5,104 @@
 # - Builds BaseColor + Normal + Roughness + Metalness atlases
 # - Creates BAKE_ATLAS UV by remapping from the UV actually used per material slot
 # - Finally assigns a single material wired to the atlases
+# Needs Pillow in Blender's Python; JPEG decoding is fastest when Pillow is linked against
+# libjpeg-turbo (the official wheels are), and Pillow-SIMD speeds up resizing further.
+
+import bpy, os, sys, math, json, shutil, tempfile, contextlib, importlib
+import numpy as np
+try:  # optional: JIT-compiled UV remap kernel
+    from numba import njit as _njit, prange as _prange
+except Exception:
+    _njit = _prange = None
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+def _optional_extension(name):
+    """Compiled helper module built by setup_extensions.py, or None when it isn't built.
+    Also looked up next to this script, which Blender does not put on sys.path."""
+    here = os.path.dirname(os.path.abspath(globals().get('__file__') or ''))
+    if globals().get('__file__') and os.path.isdir(here) and here not in sys.path:
+        sys.path.append(here)
+    try:
+        return importlib.import_module(name)
+    except Exception:
+        return None
 
-import bpy, os, math, json, tempfile
+_uv_remap = _optional_extension('_uv_remap')  # optional: compiled UV remap kernel
 
 # ------------- OPTIONS -----------------
 OUTPUT_DIR = None          # None -> //atlas_out next to .blend
 ATLAS_BASENAME = None      # None -> object name
 PADDING_PX = 32
-TILE_W = None              # None -> max source width
-TILE_H = None              # None -> max source height
+TILE_W = None              # None -> source width ('shelf': per slot, grids: max)
+TILE_H = None              # None -> source height ('shelf': per slot, grids: max)
 FORCE_POW2 = True
-RESAMPLE = 'LANCZOS'       # 'NEAREST' | 'BILINEAR' | 'BICUBIC' | 'LANCZOS'
-LAYOUT = 'auto'            # 'auto' | 'row' | 'col' | (rows, cols)
+ALLOW_ROTATE = True        # shelf layout: store wide tiles transposed (height >= width)
+# Resizing is the hottest step: Pillow-SIMD (built from source, see README) is a drop-in,
+# binary-compatible Pillow with SSE4/AVX2 resample kernels, typically 2-3x faster.
+RESAMPLE = 'LANCZOS'       # 'NEAREST' | 'BOX' | 'BILINEAR' | 'BICUBIC' | 'LANCZOS'
+FAST_RESAMPLE = False      # True -> BOX for downscales of 2x or more on both axes
+STRIPE_RESIZE_MPX = 16     # larger sources (megapixels) are converted/resized in stripes; None -> never
+LAYOUT = 'shelf'           # 'shelf' (packed, per-slot tile sizes) | grid: 'auto' | 'row' | 'col' | (rows, cols)
+PNG_COMPRESS_LEVEL = 1     # 0 (store) .. 9 (smallest); 1 is fast, 6 is Pillow's default
+ATLAS_FORMAT = 'PNG'       # 'PNG' | 'TIFF' (uncompressed: fastest write, largest) | 'TIFF_LZW'
 MATERIAL_NAME = 'AtlasMaterial'
 UV_NAME = 'BAKE_ATLAS'
+NORMAL_HAS_ALPHA = False   # True -> alpha-blend normal tiles (only for maps with real transparency)
+UV_ZERO_COPY = True        # Blender 3.5+: read source UVs in place instead of copying them out
+SINGLE_SLOT_FAST_PATH = True  # one fully textured slot -> copy its maps instead of building an atlas
+USE_NUMBA = True           # use the numba (per-polygon, multi-threaded) UV remap kernel when installed
+USE_COMPILED_UV = True     # without numba: use the UV remap kernel built by setup_extensions.py
+THREADS = None             # None -> os.cpu_count(); 1 -> no worker threads
 # --------------------------------------
 
+_PIL = None  # (Image, ImageOps) once imported and reported
+
 def _get_pil():
+    global _PIL
+    if _PIL is not None: return _PIL
     try:
         from PIL import Image, ImageOps
-        return Image, ImageOps
     except Exception as e:
         raise RuntimeError(
             "Pillow (PIL) is required. In Blender's Python Console run:\n"
             "import ensurepip, pip; ensurepip.bootstrap(); pip.main(['install','pillow'])\n"
+            "(the README describes building the faster Pillow-SIMD on x86;\n"
+            " JPEG decoding is fastest with a Pillow build linked against libjpeg-turbo)\n"
             f"Original import error: {e}"
         )
+    _report_pil_build()
+    _PIL = (Image, ImageOps)
+    return _PIL
+
+def _report_pil_build():
+    """Log which Pillow build is active; Pillow-SIMD speeds up resize/paste but is optional."""
+    try:
+        import PIL, PIL.features
+        version = getattr(PIL, '__version__', '?')
+        simd = _pil_is_simd()
+        try:
+            turbo = PIL.features.check_feature('libjpeg_turbo')
+        except ValueError:
+            turbo = None  # Pillow too old to report it
+        jpeg = None
+        if hasattr(PIL.features, 'version'):
+            jpeg = (f"libjpeg-turbo {PIL.features.version('libjpeg_turbo')}" if turbo
+                    else f"libjpeg {PIL.features.version('jpg')}")
+    except Exception as e:
+        print('PIL info warning:', e)
+        return
+    kind = 'Pillow-SIMD' if simd else 'Pillow (stock)'
+    print(f"[PIL] {kind} {version}" + (f", {jpeg}" if jpeg else ''))
+    if not simd:
+        print("[PIL] Pillow-SIMD resizes faster; see the README for how to build it")
+    if turbo is False:
+        print("[PIL] Warning: Pillow is linked against plain libjpeg, not libjpeg-turbo; JPEG sources\n"
+              "      decode 2-6x slower. Official Pillow wheels ship libjpeg-turbo: reinstall from PyPI.")
+
+def _pil_is_simd():
+    # Pillow-SIMD releases carry a '.postN' suffix on the upstream version
+    import PIL
+    return '.post' in getattr(PIL, '__version__', '')
 
 def _get_scene_dir():
     if bpy.data.is_saved:
@@ -40,10 +112,19 @@ def _get_scene_dir():
 def _abspath(path):
     return bpy.path.abspath(path) if path else ''
 
+def _source_id(src):
+    """Canonical identity of a texture source (None if missing), so each is decoded once:
+    the real path of a file, or a per-object key for an in-memory PIL image."""
+    if src is not None and not isinstance(src, str): return ('<pixels>', id(src))
+    if not src or not os.path.exists(src): return None
+    return os.path.normcase(os.path.realpath(src))
+
+def _open_source(Image, src):
+    """Context manager giving a PIL image for a source; in-memory images are left open."""
+    return Image.open(src) if isinstance(src, str) else contextlib.nullcontext(src)
+
 def _pow2(n):
-    p = 1
-    while p < n: p <<= 1
-    return p
+    return 1 if n <= 1 else 1 << (n - 1).bit_length()
 
 def _choose_layout(n):
     if isinstance(LAYOUT, tuple) and len(LAYOUT) == 2:
@@ -55,11 +136,104 @@ def _choose_layout(n):
     rows = math.ceil(n / cols)
     return rows, cols
 
-def _resample_mode(Image):
-    key = RESAMPLE.upper()
+def _is_fast_downscale(src_size, dst_size):
+    """True for downscales of at least 2x on both axes: BOX averages enough source pixels
+    per output pixel there to look close to LANCZOS (exactly so for integer ratios)."""
+    (sw, sh), (dw, dh) = src_size, dst_size
+    return sw >= 2*dw and sh >= 2*dh
+
+def _resize_striped(Image, src, mode, size, filt, factors, stripe_px):
+    """Resize `src` to `size` one horizontal stripe of about `stripe_px` source pixels at a time,
+    converting to `mode` and box-reducing by `factors` per stripe, so no full-size converted
+    copy of a huge source is ever held (crop() still decodes `src` itself in full). Each
+    stripe carries enough extra rows for the filter's support, so the result matches the
+    one-shot path up to float rounding of the stripe offsets (which can move a BOX window
+    edge by one source row at exact ties)."""
+    fx, fy = factors
+    W, H = src.size
+    rw, rh = -(-W // fx), -(-H // fy)  # reduce() keeps partial blocks at the right/bottom edge
+    w, h = size
+    scale = rh / h
+    margin = int(math.ceil(3 * max(scale, 1.0))) + 2  # rows of support; LANCZOS has the widest (3)
+    out_rows = max(1, int(stripe_px / W / fy / scale))
+    tile = Image.new(mode, size)
+    for o0 in range(0, h, out_rows):
+        o1 = min(h, o0 + out_rows)
+        y0, y1 = o0 * scale, o1 * scale  # output rows -> reduced source rows
+        r0 = max(0, int(y0) - margin); r1 = min(rh, int(math.ceil(y1)) + margin)
+        part = src.crop((0, r0 * fy, W, min(H, r1 * fy)))
+        if part.mode != mode: part = part.convert(mode)
+        if fx > 1 or fy > 1: part = part.reduce((fx, fy))
+        tile.paste(part.resize((w, o1 - o0), resample=filt, box=(0, y0 - r0, rw, y1 - r0)), (0, o0))
+    return tile
+
+def _parallel_map(fn, items):
+    """map() over a thread pool (Pillow releases the GIL in decode/resize/encode).
+    Falls back to a plain loop when threads are disabled or cannot be started."""
+    workers = min(THREADS or os.cpu_count() or 1, len(items))
+    if workers > 1:
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                return list(ex.map(fn, items))
+        except RuntimeError as e:
+            print('Thread pool warning:', e)
+    return [fn(item) for item in items]
+
+def _parallel_as_completed(fn, items):
+    """Like _parallel_map, but yields each result as soon as it is ready (in any order)."""
+    workers = min(THREADS or os.cpu_count() or 1, len(items))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            try:
+                futures = [ex.submit(fn, item) for item in items]
+            except RuntimeError as e:
+                print('Thread pool warning:', e)
+                futures = None
+            if futures is not None:
+                for f in as_completed(futures):
+                    yield f.result()
+                return
+    for item in items:
+        yield fn(item)
+
+def _shelf_pack(sizes, atlas_w):
+    """Shelf next-fit: place rects (largest first) left to right, opening a new shelf below
+    when the current one is full. Returns (origins in input order, used height)."""
+    order = sorted(range(len(sizes)), key=lambda i: (max(sizes[i]), sizes[i][1]), reverse=True)
+    origins = [None] * len(sizes)
+    x = y = PADDING_PX; shelf_h = 0
+    for i in order:
+        w, h = sizes[i]
+        if x > PADDING_PX and x + w + PADDING_PX > atlas_w:
+            x = PADDING_PX; y += shelf_h + PADDING_PX; shelf_h = 0
+        origins[i] = (x, y)
+        x += w + PADDING_PX; shelf_h = max(shelf_h, h)
+    return origins, y + shelf_h + PADDING_PX
+
+def _shelf_layout(sizes):
+    """Shelf-pack per-slot tile sizes into the smallest atlas found; returns (W, H, origins).
+    With FORCE_POW2 only the final bounding box is rounded up to powers of two."""
+    min_w = max(w for w, h in sizes) + 2*PADDING_PX
+    area = sum((w + PADDING_PX) * (h + PADDING_PX) for w, h in sizes)
+    side = max(min_w, math.ceil(math.sqrt(area)))
+    widths = [side]
+    if FORCE_POW2:
+        p = _pow2(side)
+        widths = [aw for aw in (p // 2, p, p * 2) if aw >= min_w]
+    best = None
+    for aw in widths:
+        origins, H = _shelf_pack(sizes, aw)
+        W = max(x + w for (x, _), (w, _) in zip(origins, sizes)) + PADDING_PX
+        if FORCE_POW2: W = _pow2(W); H = _pow2(H)
+        if best is None or (W*H, max(W, H)) < (best[0]*best[1], max(best[0], best[1])):
+            best = (W, H, origins)
+    return best
+
+def _resample_mode(Image, key=None):
+    key = (key or RESAMPLE).upper()
     try:
         R = Image.Resampling
-        return {'NEAREST':R.NEAREST,'BILINEAR':R.BILINEAR,'BICUBIC':R.BICUBIC,'LANCZOS':R.LANCZOS}.get(key, R.LANCZOS)
+        return {'NEAREST':R.NEAREST,'BOX':R.BOX,'BILINEAR':R.BILINEAR,'BICUBIC':R.BICUBIC,'LANCZOS':R.LANCZOS}.get(key, R.LANCZOS)
     except AttributeError:
         default = getattr(Image,'LANCZOS',None) or getattr(Image,'BICUBIC',None) or getattr(Image,'BILINEAR',None) or getattr(Image,'NEAREST',None)
         return getattr(Image, key, default)
@@ -96,20 +270,8 @@ def _find_image_input_socket_link(nt, dest_node, dest_socket_name):
     n = sock.links[0].from_node
     return n if n and n.type == 'TEX_IMAGE' else None
 
-def _find_basecolor_image_node(nt, principled):
-    n = _find_image_input_socket_link(nt, principled, 'Base Color')
-    if n: return n
-    for node in nt.nodes:
-        if node.type == 'TEX_IMAGE':
-            nm = (node.name or '').lower()
-            if any(k in nm for k in ('base','albedo','diff','color')):
-                return node
-    for node in nt.nodes:
-        if node.type == 'TEX_IMAGE':
-            return node
-    return None
-
-def _find_normal_image_node(nt, principled):
+def _find_normal_map_image_node(principled):
+    """Image feeding Principled Normal through a Normal Map node, or None."""
     normal_in = principled.inputs.get('Normal')
     if normal_in and normal_in.is_linked:
         nmap = normal_in.links[0].from_node
@@ -119,49 +281,49 @@ def _find_normal_image_node(nt, principled):
                 inode = col.links[0].from_node
                 if inode and inode.type == 'TEX_IMAGE':
                     return inode
-    n = _find_image_input_socket_link(nt, principled, 'Normal')
-    if n: return n
+    return None
+
+def _classify_texture_nodes(nt, principled):
+    """Find the Base Color, Normal, Roughness and Metallic image nodes in one pass over nt.nodes.
+    Nodes linked to the Principled BSDF win; otherwise the first TEX_IMAGE matching the
+    name/colorspace heuristics (any image at all for Base Color) is used."""
+    first = by_base = by_non_color = by_rough = by_metal = None
     for node in nt.nodes:
-        if node.type == 'TEX_IMAGE':
+        if node.type != 'TEX_IMAGE': continue
+        if first is None: first = node
+        nm = (node.name or '').lower()
+        if by_base is None and any(k in nm for k in ('base','albedo','diff','color')):
+            by_base = node
+        if by_rough is None and any(k in nm for k in ('rough', 'glossy', 'gloss')):
+            by_rough = node
+        if by_metal is None and any(k in nm for k in ('metal', 'metallic', 'metalness')):
+            by_metal = node
+        if by_non_color is None:
             img = node.image
             try:
                 if img and img.colorspace_settings.name.lower().startswith('non-'):
-                    return node
+                    by_non_color = node
             except: pass
-    return None
-
-def _find_roughness_image_node(nt, principled):
-    """Find the roughness texture node connected to Principled BSDF."""
-    n = _find_image_input_socket_link(nt, principled, 'Roughness')
-    if n: return n
-    # Search by name as fallback
-    for node in nt.nodes:
-        if node.type == 'TEX_IMAGE':
-            nm = (node.name or '').lower()
-            if any(k in nm for k in ('rough', 'glossy', 'gloss')):
-                return node
-    return None
-
-def _find_metalness_image_node(nt, principled):
-    """Find the metalness/metallic texture node connected to Principled BSDF."""
-    n = _find_image_input_socket_link(nt, principled, 'Metallic')
-    if n: return n
-    # Search by name as fallback
-    for node in nt.nodes:
-        if node.type == 'TEX_IMAGE':
-            nm = (node.name or '').lower()
-            if any(k in nm for k in ('metal', 'metallic', 'metalness')):
-                return node
-    return None
-
-def _image_to_path(img, out_dir):
-    os.makedirs(out_dir, exist_ok=True)
+    base = _find_image_input_socket_link(nt, principled, 'Base Color') or by_base or first
+    normal = (_find_normal_map_image_node(principled) or
+              _find_image_input_socket_link(nt, principled, 'Normal') or by_non_color)
+    roughness = _find_image_input_socket_link(nt, principled, 'Roughness') or by_rough
+    metalness = _find_image_input_socket_link(nt, principled, 'Metallic') or by_metal
+    return base, normal, roughness, metalness
+
+def _image_source(img, out_dir):
+    """Texture source for a Blender image: its file when that exists on disk, else its
+    pixels as an in-memory PIL image (no PNG encode/decode round-trip), else a PNG that
+    Blender writes to out_dir."""
     if not img: return None
     # Prefer existing file path
     src = _abspath(img.filepath)
     if src and os.path.exists(src):
         return src
-    # Save packed image
+    im = _pixels_to_pil(img)
+    if im is not None: return im
+    # Float/unusual buffers: let Blender's own writer handle colorspace
+    os.makedirs(out_dir, exist_ok=True)
     safe = (img.name or 'Image').replace('.', '_').replace(' ', '_')
     path = os.path.join(out_dir, f'{safe}.png')
     img.filepath_raw = path
@@ -169,113 +331,416 @@ def _image_to_path(img, out_dir):
     img.save()
     return path
 
+def _pixels_to_pil(img):
+    """A byte image's pixels as a PIL image, or None for float/unusual buffers."""
+    mode = {1: 'L', 3: 'RGB', 4: 'RGBA'}.get(img.channels)
+    w, h = img.size
+    if img.is_float or not mode or not w or not h: return None
+    Image, _ = _get_pil()
+    px = np.empty(w * h * img.channels, dtype=np.float32)
+    img.pixels.foreach_get(px)
+    # Blender stores rows bottom-up as 0..1 floats; scale in place so the only extra
+    # full-size buffer is the uint8 result
+    px *= 255.0; px += 0.5
+    np.clip(px, 0, 255, out=px)
+    arr = px.reshape(h, w, img.channels)[::-1].astype(np.uint8)
+    return Image.fromarray(arr.squeeze(2) if mode == 'L' else arr, mode)
+
 # -------- Build atlases --------
+# (slot key, tile mode, fill used when the slot has no texture), in atlas order; a slot's
+# value is a file path, or a PIL image for packed textures
+_CHANNELS = (
+    ('base_path',      'RGB',  (0,0,0)),
+    ('normal_path',    'RGBA', (128,128,255,255)),
+    ('roughness_path', 'L',    128),
+    ('metalness_path', 'L',    128),
+)
+
+def _atlas_ext():
+    return '.png' if ATLAS_FORMAT == 'PNG' else '.tif'
+
+def _save_atlas(im, path):
+    if ATLAS_FORMAT == 'TIFF':
+        im.save(path, 'TIFF')  # no compression: the write is little more than a copy
+    elif ATLAS_FORMAT == 'TIFF_LZW':
+        im.save(path, 'TIFF', compression='tiff_lzw')
+    else:
+        # zlib level 1 encodes several times faster than the default 6 for ~20% larger files
+        im.save(path, 'PNG', compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+
+def _unique_slot_groups(slot_images):
+    """Parallel lists (source ids per channel, [slot indices]), one entry per distinct set of
+    textures: slots using the same files share one atlas rect (their own source UVs still
+    pick what they sample)."""
+    groups = {}
+    for s in slot_images:
+        src_ids = tuple(_source_id(s.get(key)) for key, _, _ in _CHANNELS)
+        groups.setdefault(src_ids, []).append(s['slot_index'])
+    return list(groups.keys()), list(groups.values())
+
+def _sources(slot_images):
+    """{source id: path or PIL image} for every texture the slots use."""
+    return {_source_id(s[key]): s[key] for s in slot_images for key, _, _ in _CHANNELS if s.get(key) is not None}
+
+def _known_sizes(slot_images):
+    """{source id: (w, h)} from the sizes main() took off the Blender images, so atlas
+    layout needs no header probing of files Blender already loaded."""
+    known = {}
+    for s in slot_images:
+        for key, size in (s.get('sizes') or {}).items():
+            if s.get(key) is not None and size and all(size):
+                known.setdefault(_source_id(s[key]), tuple(size))
+    return known
+
+def _image_size(Image, src, known):
+    size = known.get(_source_id(src))
+    if size: return size
+    with _open_source(Image, src) as im:
+        return im.size
+
 def _build_atlases(slot_images, out_dir, base_name):
     Image, ImageOps = _get_pil()
-    sizes = []
-    for s in slot_images:
-        with Image.open(s['base_path']) as im:
-            sizes.append(im.size)
-    max_w = max(w for w,h in sizes); max_h = max(h for w,h in sizes)
-    tw = TILE_W or max_w; th = TILE_H or max_h
-    rows, cols = _choose_layout(len(slot_images))
-    W = cols*tw + (cols+1)*PADDING_PX
-    H = rows*th + (rows+1)*PADDING_PX
-    if FORCE_POW2: W = _pow2(W); H = _pow2(H)
-    atlas_base = Image.new('RGB', (W, H), (20,20,20))
-    atlas_norm = Image.new('RGBA', (W, H), (20,20,20,255))
-    atlas_rough = Image.new('L', (W, H), 128)  # Grayscale for roughness
-    atlas_metal = Image.new('L', (W, H), 0)    # Grayscale for metalness
+    group_src_ids, group_slots = _unique_slot_groups(slot_images)
+    n_groups = len(group_src_ids)
+    sources = _sources(slot_images)
+    known = _known_sizes(slot_images)
+    # Natural tile size: its base color, else the first texture it has
+    sizes = [_image_size(Image, sources[next(i for i in src_ids if i)], known) for src_ids in group_src_ids]
+    if LAYOUT == 'shelf':
+        natural = [(TILE_W or w, TILE_H or h) for w, h in sizes]
+        # Stand wide tiles up (height >= width) so shelves pack tighter
+        rotated = [ALLOW_ROTATE and w > h for w, h in natural]
+        tile_sizes = [(h, w) if rot else (w, h) for (w, h), rot in zip(natural, rotated)]
+        W, H, origins = _shelf_layout(tile_sizes)
+        rows = cols = None
+        tile_px = list(natural[0]) if len(set(natural)) == 1 else None
+    else:
+        max_w = max(w for w,h in sizes); max_h = max(h for w,h in sizes)
+        tw = TILE_W or max_w; th = TILE_H or max_h
+        rows, cols = _choose_layout(n_groups)
+        W = cols*tw + (cols+1)*PADDING_PX
+        H = rows*th + (rows+1)*PADDING_PX
+        if FORCE_POW2: W = _pow2(W); H = _pow2(H)
+        tile_sizes = [(tw, th)] * n_groups
+        rotated = [False] * n_groups
+        origins = [(PADDING_PX + (i % cols)*(tw + PADDING_PX), PADDING_PX + (i // cols)*(th + PADDING_PX))
+                   for i in range(min(n_groups, rows*cols))]
+        tile_px = [tw, th]
+    # Atlases are composed as (H, W[, C]) uint8 arrays: tile blits become plain slice copies.
+    # Only alpha-blended normals still need a PIL canvas for paste's mask blending
+    atlas_base = np.full((H, W, 3), 20, dtype=np.uint8)
+    if NORMAL_HAS_ALPHA:
+        atlas_norm = Image.new('RGBA', (W, H), (20,20,20,255))
+    else:
+        atlas_norm = np.full((H, W, 4), (20,20,20,255), dtype=np.uint8)
+    atlas_rough = np.full((H, W), 128, dtype=np.uint8)  # Grayscale for roughness
+    atlas_metal = np.full((H, W), 0, dtype=np.uint8)    # Grayscale for metalness
     resample = _resample_mode(Image)
-
-    def place(img_path, x, y, canvas, is_normal=False, is_grayscale=False):
-        if img_path and os.path.exists(img_path):
-            if is_grayscale:
-                im = Image.open(img_path).convert('L')
-            else:
-                im = Image.open(img_path).convert('RGBA' if is_normal else 'RGB')
+    box = _resample_mode(Image, 'BOX')
+    nearest = _resample_mode(Image, 'NEAREST')
+    transverse = getattr(Image, 'Transpose', Image).TRANSVERSE
+
+    def load_and_resize(src_id, jobs):
+        """Decode source `src_id` once and return (src_id, {(mode, w, h, rot): tile}) for every
+        job. (w, h) is the packed tile size; rotated tiles are resized to (h, w) then transposed."""
+        out = {}
+        sizes = [(h, w) if rot else (w, h) for _, w, h, rot in jobs]
+        with _open_source(Image, sources[src_id]) as src:
+            if src.format == 'JPEG':
+                # Let libjpeg decode at a reduced DCT scale (still >= the largest tile), and
+                # straight to grayscale when only roughness/metalness tiles need this file
+                modes = {mode for mode, _, _, _ in jobs}
+                need = (max(w for w, _ in sizes), max(h for _, h in sizes))
+                try:
+                    src.draft('L' if modes == {'L'} else 'RGB', need)
+                except Exception as e:
+                    print('Draft warning:', e)
+            # Huge sources that need a mode conversion: convert/reduce/resize stripe by stripe so
+            # no full-size converted copy is held (the decoded source itself stays resident)
+            stripe_px = int(STRIPE_RESIZE_MPX * 1e6) if STRIPE_RESIZE_MPX else 0
+            huge = stripe_px and src.width * src.height > stripe_px and hasattr(src, 'reduce')
+            converted = {}
+            for mode, w, h, rot in sorted(jobs):
+                size = (h, w) if rot else (w, h)
+                filt = box if FAST_RESAMPLE and _is_fast_downscale(src.size, size) else resample
+                # Big downscales: integer box-reduce first (cheap), leaving the chosen filter
+                # a 2x-4x step so it still shapes the result; NEAREST keeps its hard pixels
+                fx, fy = max(1, src.width // (2*size[0])), max(1, src.height // (2*size[1]))
+                if max(fx, fy) < 2 or filt == nearest or not hasattr(src, 'reduce'): fx = fy = 1
+                if huge and src.mode != mode:
+                    tile = _resize_striped(Image, src, mode, size, filt, (fx, fy), stripe_px)
+                else:
+                    im = converted.get(mode)
+                    if im is None:
+                        im = converted[mode] = src if src.mode == mode else src.convert(mode)
+                    if fx > 1 or fy > 1:
+                        reduced = im.reduce((fx, fy))
+                        tile = reduced.resize(size, resample=filt)
+                        reduced.close()
+                    else:
+                        tile = im.resize(size, resample=filt)
+                if rot:
+                    # Anti-diagonal flip (matches the u<->v swap in the UV remap)
+                    tile = tile.transpose(transverse)
+                    if mode == 'RGBA':
+                        # Normal map: tangent and bitangent trade places, so swap R and G
+                        r, g, b, a = tile.split()
+                        tile = Image.merge('RGBA', (g, r, b, a))
+                out[(mode, w, h, rot)] = tile
+            for im in converted.values():
+                if im is not src: im.close()
+        return src_id, out
+
+    def place(im, mode, fill, x, y, w, h, canvas):
+        """Blit tile `im` (or solid `fill` when None) into the canvas rect at (x, y)."""
+        if isinstance(canvas, np.ndarray):
+            canvas[y:y + h, x:x + w] = fill if im is None else np.asarray(im)
+        elif im is None:
+            canvas.paste(fill, (x, y, x + w, y + h))
+        elif mode == 'RGBA' and NORMAL_HAS_ALPHA:
+            canvas.paste(im, (x, y), im)  # blend over the canvas using the tile's alpha
         else:
-            if is_grayscale:
-                im = Image.new('L', (tw, th), 128)
-            else:
-                im = Image.new('RGBA' if is_normal else 'RGB', (tw, th), (128,128,255,255) if is_normal else (0,0,0))
-        im = im.resize((tw, th), resample=resample)
-        if is_grayscale:
             canvas.paste(im, (x, y))
-        else:
-            canvas.paste(im, (x, y), im if im.mode == 'RGBA' else None)
-        im.close()
-
-    rects_px = []
-    idx = 0
-    for r in range(rows):
-        for c in range(cols):
-            if idx >= len(slot_images): break
-            x0 = PADDING_PX + c*(tw + PADDING_PX)
-            y0 = PADDING_PX + r*(th + PADDING_PX)
-            x1 = x0 + tw; y1 = y0 + th
-            s = slot_images[idx]
-            place(s['base_path'], x0, y0, atlas_base, is_normal=False)
-            place(s.get('normal_path'), x0, y0, atlas_norm, is_normal=True)
-            place(s.get('roughness_path'), x0, y0, atlas_rough, is_grayscale=True)
-            place(s.get('metalness_path'), x0, y0, atlas_metal, is_grayscale=True)
-            rects_px.append((s['slot_index'], [x0,y0,x1,y1]))
-            idx += 1
+
+    # Group every input by source file so each one is decoded once, however many
+    # slots/atlases or differently spelled paths refer to it; decode/resize in parallel
+    wanted = {}
+    users = {}  # source id -> [(mode, x0, y0, w, h, rot, canvas)] pasted from its tiles
+    canvases = (atlas_base, atlas_norm, atlas_rough, atlas_metal)
+    rects_px = []      # per placed tile: ([x0, y0, x1, y1], rotated)
+    tile_of_slot = {}  # slot index -> tile index (slots sharing files share a tile)
+    for slots, src_ids, (x0, y0), (w, h), rot in zip(group_slots, group_src_ids, origins, tile_sizes, rotated):
+        for src_id, (_, mode, fill), canvas in zip(src_ids, _CHANNELS, canvases):
+            if src_id:
+                wanted.setdefault(src_id, set()).add((mode, w, h, rot))
+                users.setdefault(src_id, []).append((mode, x0, y0, w, h, rot, canvas))
+            else:
+                place(None, mode, fill, x0, y0, w, h, canvas)
+        for slot_idx in slots: tile_of_slot[slot_idx] = len(rects_px)
+        rects_px.append(([x0, y0, x0 + w, y0 + h], rot))
+
+    # Submit decodes top-down and blit each source's tiles in (y0, x0) order, so consecutive
+    # copies tend to land in nearby canvas rows instead of striding the whole atlas
+    row_major = lambda use: (use[2], use[1])
+    for uses in users.values(): uses.sort(key=row_major)
+    jobs = sorted(wanted.items(), key=lambda item: row_major(users[item[0]][0]))
+    # Paste each source's tiles as soon as its decode finishes, on this thread only (keeps
+    # canvas writes race-free), then free them right away
+    for src_id, tiles in _parallel_as_completed(lambda item: load_and_resize(*item), jobs):
+        for mode, x0, y0, w, h, rot, canvas in users[src_id]:
+            place(tiles[(mode, w, h, rot)], mode, None, x0, y0, w, h, canvas)
+        for im in tiles.values(): im.close()
+    atlas_base = Image.fromarray(atlas_base, 'RGB')
+    if isinstance(atlas_norm, np.ndarray): atlas_norm = Image.fromarray(atlas_norm, 'RGBA')
+    atlas_rough = Image.fromarray(atlas_rough, 'L')
+    atlas_metal = Image.fromarray(atlas_metal, 'L')
 
     os.makedirs(out_dir, exist_ok=True)
-    base_path = os.path.join(out_dir, f'{base_name}_BaseColor.png')
-    norm_path = os.path.join(out_dir, f'{base_name}_Normal.png')
-    rough_path = os.path.join(out_dir, f'{base_name}_Roughness.png')
-    metal_path = os.path.join(out_dir, f'{base_name}_Metalness.png')
-    atlas_base.save(base_path, 'PNG'); atlas_norm.save(norm_path, 'PNG')
-    atlas_rough.save(rough_path, 'PNG'); atlas_metal.save(metal_path, 'PNG')
-
-    rects_uv = {}
-    for slot_idx, (x0,y0,x1,y1) in rects_px:
-        u0 = x0 / W; u1 = x1 / W
-        v0 = 1.0 - (y1 / H); v1 = 1.0 - (y0 / H)
-        rects_uv[slot_idx] = (u0, v0, u1, v1)
+    base_path = os.path.join(out_dir, f'{base_name}_BaseColor{_atlas_ext()}')
+    norm_path = os.path.join(out_dir, f'{base_name}_Normal{_atlas_ext()}')
+    rough_path = os.path.join(out_dir, f'{base_name}_Roughness{_atlas_ext()}')
+    metal_path = os.path.join(out_dir, f'{base_name}_Metalness{_atlas_ext()}')
+    # The four encodes are independent and zlib-bound (GIL released): write them concurrently
+    _parallel_map(lambda job: _save_atlas(*job), [
+        (atlas_base, base_path), (atlas_norm, norm_path),
+        (atlas_rough, rough_path), (atlas_metal, metal_path),
+    ])
+
+    # Pixel rects -> UV rects (v flipped) in one float64 pass over the unique tiles
+    px = np.array([r for r, _ in rects_px], dtype=np.float64).reshape(-1, 4)
+    uv = np.column_stack((px[:, 0] / W, 1.0 - px[:, 3] / H, px[:, 2] / W, 1.0 - px[:, 1] / H))
+    tile_uv = [tuple(r) for r in uv.tolist()]
+    rects_uv = {slot_idx: tile_uv[t] for slot_idx, t in tile_of_slot.items()}
+    rotated_by_slot = {slot_idx: rects_px[t][1] for slot_idx, t in tile_of_slot.items()}
 
     manifest = {
         'image_size_px': [W, H],
-        'tile_size_px': [tw, th],
+        'tile_size_px': tile_px,  # None when shelf-packed tiles differ in size
         'padding_px': PADDING_PX,
-        'rows_cols': [rows, cols],
+        'rows_cols': [rows, cols] if rows else None,
         'rects_uv_by_slot_index': rects_uv,
+        'rotated_by_slot_index': rotated_by_slot,  # tile stored transposed (u <-> v)
+        'tile_index_by_slot_index': tile_of_slot,
     }
+    _write_manifest(manifest, out_dir, base_name)
+    return base_path, norm_path, rough_path, metal_path, manifest
+
+def _write_manifest(manifest, out_dir, base_name):
     with open(os.path.join(out_dir, f'{base_name}_manifest.json'), 'w', encoding='utf-8') as f:
         json.dump(manifest, f, indent=2)
-    return base_path, norm_path, rough_path, metal_path, manifest
+
+def _copy_single_slot(slot_images, out_dir, base_name):
+    """A single fully textured slot (or several sharing the same files) needs no atlas:
+    copy its textures next to where the atlases would go and map its UVs 1:1. Returns the
+    same tuple as _build_atlases, or None when the full build is needed (missing maps,
+    TILE_W/TILE_H resize, non-pow2 source)."""
+    if not SINGLE_SLOT_FAST_PATH: return None
+    group_src_ids, group_slots = _unique_slot_groups(slot_images)
+    if len(group_src_ids) != 1 or not all(group_src_ids[0]): return None
+    paths = [slot_images[0].get(key) for key, _, _ in _CHANNELS]  # every slot uses these sources
+    Image, ImageOps = _get_pil()
+    known = _known_sizes(slot_images)
+    for p in paths:
+        w, h = _image_size(Image, p, known)
+        if (TILE_W or w, TILE_H or h) != (w, h): return None
+        if FORCE_POW2 and (_pow2(w), _pow2(h)) != (w, h): return None
+    os.makedirs(out_dir, exist_ok=True)
+    out_paths = []
+    for p, suffix in zip(paths, ('BaseColor', 'Normal', 'Roughness', 'Metalness')):
+        if not isinstance(p, str):  # packed texture held in memory: write it out
+            dst = os.path.join(out_dir, f'{base_name}_{suffix}{_atlas_ext()}')
+            _save_atlas(p, dst)
+        else:
+            dst = os.path.join(out_dir, f'{base_name}_{suffix}{os.path.splitext(p)[1].lower()}')
+            if _source_id(dst) != _source_id(p):
+                shutil.copyfile(p, dst)
+        out_paths.append(dst)
+    w, h = _image_size(Image, paths[0], known)
+    manifest = {
+        'image_size_px': [w, h],
+        'tile_size_px': [w, h],
+        'padding_px': 0,
+        'rows_cols': [1, 1],
+        'rects_uv_by_slot_index': {i: (0.0, 0.0, 1.0, 1.0) for i in group_slots[0]},
+        'rotated_by_slot_index': {i: False for i in group_slots[0]},
+        'tile_index_by_slot_index': {i: 0 for i in group_slots[0]},
+    }
+    _write_manifest(manifest, out_dir, base_name)
+    return (*out_paths, manifest)
 
 # -------- UV remap (per-slot source UV) --------
-def _remap_uvs_to_atlas_with_slot_uv(obj, slot_to_src_uv, dst_uv_name, rects_uv_by_slot, poly_slot_index_cache):
+def _uv_view(layer, n_loops):
+    """Zero-copy, read-only (n_loops, 2) float32 view of a UV layer's storage, or None.
+    Blender 3.5+ keeps UVs in one contiguous float2 attribute array; the view is checked
+    against RNA before use and must not outlive the current remap."""
+    if not UV_ZERO_COPY or bpy.app.version < (3, 5, 0): return None
+    try:
+        import ctypes
+        first, last = layer.data[0], layer.data[n_loops - 1]
+        buf = (ctypes.c_float * (n_loops * 2)).from_address(first.as_pointer())
+        view = np.ctypeslib.as_array(buf).reshape(n_loops, 2)
+        if tuple(view[0]) != tuple(first.uv) or tuple(view[-1]) != tuple(last.uv):
+            return None  # unexpected layout: use the foreach_get copy instead
+    except Exception:
+        return None
+    view.flags.writeable = False  # writes must go through foreach_set (copy-on-write data)
+    return view
+
+def _read_uvs(layer, n_loops):
+    """UVs of a layer as an (n_loops, 2) float32 array: zero-copy view when possible, else bulk-read."""
+    view = _uv_view(layer, n_loops)
+    if view is not None: return view
+    buf = np.empty(n_loops * 2, dtype=np.float32)
+    layer.data.foreach_get('uv', buf)
+    return buf.reshape(n_loops, 2)
+
+def _remap_loops_np(rect, mapped, src, out):
+    """out[i] = rect origin + src[i] * rect size where mapped[i] (u/v swapped for rotated
+    rects), else src[i] unchanged."""
+    rot = rect[:, 4] == 1
+    su = np.where(rot, src[:, 1], src[:, 0])  # rotated tiles: swap u/v
+    sv = np.where(rot, src[:, 0], src[:, 1])
+    out[:, 0] = rect[:, 0] + su*rect[:, 2]
+    out[:, 1] = rect[:, 1] + sv*rect[:, 3]
+    np.copyto(out, src, where=~mapped[:, None])
+
+def _jit(fn):
+    """numba.njit(parallel=True), cached on disk when the script's folder allows it."""
+    try:
+        return _njit(parallel=True, cache=True)(fn)
+    except Exception:  # e.g. run from a Text block: no file to cache next to
+        return _njit(parallel=True)(fn)
+
+if _njit is not None:
+    @_jit
+    def _remap_polys_jit(src, dst, loop_start, loop_total, mat_idx, rects, mask):
+        """Per-polygon remap, polygons spread over threads with prange: each polygon's loops
+        get its slot's rect (u/v swapped when rotated), or a plain copy if the slot has none."""
+        for p in _prange(loop_start.shape[0]):
+            m = mat_idx[p]; ls = loop_start[p]; le = ls + loop_total[p]
+            if not mask[m]:
+                for li in range(ls, le):
+                    dst[li, 0] = src[li, 0]; dst[li, 1] = src[li, 1]
+                continue
+            u0 = rects[m, 0]; v0 = rects[m, 1]; du = rects[m, 2]; dv = rects[m, 3]
+            if rects[m, 4] == 1:
+                for li in range(ls, le):
+                    dst[li, 0] = u0 + src[li, 1]*du; dst[li, 1] = v0 + src[li, 0]*dv
+            else:
+                for li in range(ls, le):
+                    dst[li, 0] = u0 + src[li, 0]*du; dst[li, 1] = v0 + src[li, 1]*dv
+else:
+    _remap_polys_jit = None
+
+def _read_poly_ints(me, attr):
+    """Bulk-read an int attribute of every polygon (loop_start, loop_total, material_index)."""
+    buf = np.empty(len(me.polygons), dtype=np.int32)
+    me.polygons.foreach_get(attr, buf)
+    return buf
+
+def _remap_uvs_to_atlas_with_slot_uv(obj, slot_to_src_uv, dst_uv_name, rects_uv_by_slot,
+                                     rotated_by_slot=None):
     me = obj.data
     dst = me.uv_layers.get(dst_uv_name) or me.uv_layers.new(name=dst_uv_name)
     me.uv_layers.active = dst; dst.active = True; dst.active_render = True
 
-    # Build a cache of UV layer data by name
-    uvdata_by_name = {uv.name: uv.data for uv in me.uv_layers}
-
-    loop_index = 0
-    for poly_idx, poly in enumerate(me.polygons):
-        slot_idx = poly_slot_index_cache[poly_idx]
-        rect = rects_uv_by_slot.get(slot_idx)
+    n_loops = len(me.loops)
+    if not n_loops: return
+    layers_by_name = {uv.name: uv for uv in me.uv_layers}
+    # fallback to active render, then active
+    fallback = next((uv for uv in me.uv_layers if uv.active_render), me.uv_layers.active)
+
+    # Per-loop slot index; polygons own contiguous loop ranges, normally already ascending
+    loop_starts = _read_poly_ints(me, 'loop_start')
+    loop_totals = _read_poly_ints(me, 'loop_total')
+    poly_slot = _read_poly_ints(me, 'material_index')
+    if np.any(loop_starts[1:] < loop_starts[:-1]):
+        order = np.argsort(loop_starts, kind='stable')
+        loop_starts = loop_starts[order]; loop_totals = loop_totals[order]; poly_slot = poly_slot[order]
+    loop_slot = np.repeat(poly_slot, loop_totals)
+
+    # Group slots by the source UV layer they sample, so each layer is read exactly once.
+    # bincount/LUT gathers keep this O(n_loops); np.unique/np.isin would sort every loop.
+    n_slots = max(max(rects_uv_by_slot, default=-1), int(loop_slot.max())) + 1
+    slots = np.flatnonzero(np.bincount(loop_slot, minlength=n_slots)).tolist()
+    groups = {}  # layer name -> (layer, [slot indices])
+    for slot_idx in slots:
         # which source UV to sample?
-        src_name = slot_to_src_uv.get(slot_idx)
-        src_data = uvdata_by_name.get(src_name) if src_name in uvdata_by_name else None
-        if not src_data:
-            # fallback to active render, then active
-            src_layer = next((uv for uv in me.uv_layers if uv.active_render), me.uv_layers.active)
-            src_data = src_layer.data
-        if not rect:
-            # copy through
-            for li in range(poly.loop_start, poly.loop_start + poly.loop_total):
-                dst.data[li].uv = src_data[li].uv
-            continue
-        u0,v0,u1,v1 = rect; du=(u1-u0); dv=(v1-v0)
-        for li in range(poly.loop_start, poly.loop_start + poly.loop_total):
-            su,sv = src_data[li].uv
-            dst.data[li].uv = (u0 + su*du, v0 + sv*dv)
+        src_layer = layers_by_name.get(slot_to_src_uv.get(slot_idx)) or fallback
+        groups.setdefault(src_layer.name, (src_layer, []))[1].append(slot_idx)
+    if len(groups) == 1:
+        src = _read_uvs(next(iter(groups.values()))[0], n_loops)
+    else:
+        src = np.empty((n_loops, 2), dtype=np.float32)
+        in_group = np.zeros(n_slots, dtype=bool)
+        for src_layer, group_slots in groups.values():
+            in_group[:] = False; in_group[group_slots] = True
+            np.copyto(src, _read_uvs(src_layer, n_loops), where=in_group[loop_slot][:, None])
+
+    # Dense LUT indexed by material_index: (u0, v0, du, dv, rotated) plus a has-rect mask;
+    # loops of slots without a rect keep their source UVs
+    n_slots = max(n_slots, len(me.materials))
+    lut = np.zeros((n_slots, 5), dtype=np.float32)
+    has_rect = np.zeros(n_slots, dtype=bool)
+    if rects_uv_by_slot:
+        idx = np.fromiter(rects_uv_by_slot, dtype=np.intp, count=len(rects_uv_by_slot))
+        r = np.array(list(rects_uv_by_slot.values()), dtype=np.float64).reshape(-1, 4)
+        rot = [bool((rotated_by_slot or {}).get(i)) for i in rects_uv_by_slot]
+        lut[idx] = np.column_stack((r[:, :2], r[:, 2:] - r[:, :2], rot))
+        has_rect[idx] = True
+    out = np.empty((n_loops, 2), dtype=np.float32)
+    # Backends, fastest first: numba (multi-threaded), compiled (setup_extensions.py,
+    # single-threaded), NumPy. Both kernels work on the polygon arrays directly: no
+    # per-loop rect gather needed
+    if _remap_polys_jit is not None and USE_NUMBA:
+        _remap_polys_jit(np.ascontiguousarray(src), out, loop_starts, loop_totals, poly_slot, lut, has_rect)
+    elif _uv_remap is not None and USE_COMPILED_UV:
+        _uv_remap.remap(np.ascontiguousarray(src), out, loop_starts, loop_totals, poly_slot,
+                        lut, has_rect.view(np.uint8))
+    else:
+        # one gather gives every loop its rect
+        _remap_loops_np(lut[loop_slot], has_rect[loop_slot], src, out)
+    dst.data.foreach_set('uv', out.ravel())
 
 # -------- One-material shader --------
 def _create_atlas_material(obj, base_path, norm_path, rough_path, metal_path, mat_name, uv_name):
@@ -338,32 +803,34 @@ def main():
     scene_dir = _get_scene_dir()
     out_dir = bpy.path.abspath(OUTPUT_DIR) if OUTPUT_DIR else os.path.join(scene_dir, 'atlas_out')
     base_name = (ATLAS_BASENAME or obj.name).replace(' ', '_')
-    tmp_dir = os.path.join(out_dir, '_tmp_src'); os.makedirs(tmp_dir, exist_ok=True)
+    tmp_dir = os.path.join(out_dir, '_tmp_src')
 
     # PER-SLOT: find base + normal + roughness + metalness images and the UV map name actually used
     slot_images = []
     slot_to_src_uv = {}
+    image_sources = {}  # image name -> source: a packed image shared by slots is read out once
+    def source_of(img):
+        if img.name_full not in image_sources:
+            image_sources[img.name_full] = _image_source(img, tmp_dir)
+        return image_sources[img.name_full]
     for idx, mat in enumerate(obj.data.materials):
         if not mat or not mat.use_nodes or not mat.node_tree: continue
         nt = mat.node_tree
         bsdf = _find_principled(nt)
         if not bsdf: continue
-        base_node = _find_basecolor_image_node(nt, bsdf)
-        normal_node = _find_normal_image_node(nt, bsdf)
-        roughness_node = _find_roughness_image_node(nt, bsdf)
-        metalness_node = _find_metalness_image_node(nt, bsdf)
+        base_node, normal_node, roughness_node, metalness_node = _classify_texture_nodes(nt, bsdf)
         
         base_img = base_node.image if base_node else None
         normal_img = normal_node.image if normal_node else None
         roughness_img = roughness_node.image if roughness_node else None
         metalness_img = metalness_node.image if metalness_node else None
         
-        base_path = _image_to_path(base_img, tmp_dir) if base_img else None
-        normal_path = _image_to_path(normal_img, tmp_dir) if normal_img else None
-        roughness_path = _image_to_path(roughness_img, tmp_dir) if roughness_img else None
-        metalness_path = _image_to_path(metalness_img, tmp_dir) if metalness_img else None
+        base_path = source_of(base_img) if base_img else None
+        normal_path = source_of(normal_img) if normal_img else None
+        roughness_path = source_of(roughness_img) if roughness_img else None
+        metalness_path = source_of(metalness_img) if metalness_img else None
         
-        if not base_path and not normal_path and not roughness_path and not metalness_path:
+        if base_path is None and normal_path is None and roughness_path is None and metalness_path is None:
             # skip empty slots
             continue
         slot_images.append({
@@ -372,7 +839,13 @@ def main():
             'base_path': base_path, 
             'normal_path': normal_path,
             'roughness_path': roughness_path,
-            'metalness_path': metalness_path
+            'metalness_path': metalness_path,
+            # Sizes of images Blender already holds in memory spare re-reading file headers.
+            # Reading .size of an unloaded image would decode it, so those are probed instead
+            'sizes': {key: tuple(img.size) for key, img in (
+                ('base_path', base_img), ('normal_path', normal_img),
+                ('roughness_path', roughness_img), ('metalness_path', metalness_img))
+                if img and img.has_data},
         })
         # UV map used by this slot (prefer base's chain, else check others)
         uvname = (_upstream_uvmap_name(nt, base_node) or 
@@ -384,8 +857,9 @@ def main():
     if not slot_images:
         raise RuntimeError('No usable textures found in material slots (Base Color / Normal / Roughness / Metalness).')
 
-    # Build atlases
-    base_atlas_path, normal_atlas_path, rough_atlas_path, metal_atlas_path, manifest = _build_atlases(slot_images, out_dir, base_name)
+    # Build atlases (a lone fully textured slot is copied as-is instead)
+    base_atlas_path, normal_atlas_path, rough_atlas_path, metal_atlas_path, manifest = (
+        _copy_single_slot(slot_images, out_dir, base_name) or _build_atlases(slot_images, out_dir, base_name))
 
     # Duplicate object (single-user mesh) BEFORE modifying anything
     bpy.ops.object.select_all(action='DESELECT')
@@ -395,11 +869,9 @@ def main():
     dup.name = f'{obj.name}_ATLAS'
     dup.data = dup.data.copy()  # single-user mesh so UV edits don't touch the source
 
-    # Cache the original per-polygon material indices from the SOURCE object
-    poly_slot_index_cache = [p.material_index for p in obj.data.polygons]
-
     # Create BAKE_ATLAS UV on the duplicate by remapping from per-slot src UV
-    _remap_uvs_to_atlas_with_slot_uv(dup, slot_to_src_uv, UV_NAME, manifest['rects_uv_by_slot_index'], poly_slot_index_cache)
+    _remap_uvs_to_atlas_with_slot_uv(dup, slot_to_src_uv, UV_NAME, manifest['rects_uv_by_slot_index'],
+                                     manifest['rotated_by_slot_index'])
 
     # Now assign the single atlas material on the duplicate
     _create_atlas_material(dup, base_atlas_path, normal_atlas_path, rough_atlas_path, metal_atlas_path, MATERIAL_NAME, UV_NAME)
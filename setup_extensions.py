@@ -0,0 +1,15 @@
+# Builds the optional compiled UV remap kernel used by atlasify_selected_object.py.
+# Run it once with the Python that Blender uses (needs Cython and a C compiler), from
+# this folder:
+#   <blender>/python/bin/python setup_extensions.py build_ext --inplace
+# and keep the resulting .so/.pyd file next to the script. Without it the script
+# falls back to numba or NumPy.
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+setup(
+    name='atlasify_extensions',
+    ext_modules=cythonize([
+        Extension('_uv_remap', ['_uv_remap.pyx']),
+    ], language_level=3),
+)